@@ -1,10 +1,20 @@
 import streamlit as st
 import yaml
-import json
+import base64
+import io
+import mimetypes
+import mmap
 import os
+import threading
+import orjson
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime
-from PIL import Image
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; only the in-process lock applies
+    fcntl = None
 
 # Page configuration
 st.set_page_config(
@@ -15,8 +25,7 @@ st.set_page_config(
 )
 
 # Custom CSS for logo centering and styling
-st.markdown(
-    """
+_APP_CSS = """
 <style>
     .logo-container {
         display: flex;
@@ -71,10 +80,49 @@ st.markdown(
         font-size: 1rem;
         color: #888;
     }
+    .team-name {
+        font-size: 1.5rem;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    .cat-header {
+        font-size: 1.5rem;
+        margin-top: 0.5rem;
+        margin-bottom: 0.5rem;
+    }
+    .crit-name {
+        font-size: 1.1rem;
+        font-weight: bold;
+    }
+    .scores-tbl {
+        width: 100%;
+        font-size: 0.875rem;
+        color: #888;
+        border-collapse: collapse;
+        margin-bottom: 1rem;
+    }
+    .scores-tbl td {
+        border: none;
+        padding: 0.1rem 0;
+    }
+    .scores-tbl td:last-child {
+        text-align: right;
+    }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+
+# HTML snippets repeated across the judging form, styled by the CSS above
+_TEAM_NAME_TPL = '<div class="team-name">{}</div>'
+_CAT_HEADER_TPL = '<h2 class="cat-header">{}</h2>'
+_CRIT_NAME_TPL = '<div class="crit-name">{}</div>'
+_SCORES_TBL_TPL = '<table class="scores-tbl">{}</table>'
+_SCORE_ROW_TPL = "<tr><td>{}</td><td>{}/{}</td></tr>"
+
+
+# Emit the custom CSS. Streamlit drops elements that a rerun doesn't
+# re-emit, so this has to run on every script run, not once per session.
+def _inject_css():
+    st.markdown(_APP_CSS, unsafe_allow_html=True)
 
 
 # Load configuration
@@ -86,6 +134,25 @@ def load_config():
 
 config = load_config()
 
+
+# Max possible scores per category and per (category, criterion)
+def build_score_limits(config):
+    category_max = {
+        cat["name"]: sum(criterion["max_score"] for criterion in cat["criteria"])
+        for cat in config["categories"]
+    }
+    criterion_max = {
+        (cat["name"], criterion["name"]): criterion["max_score"]
+        for cat in config["categories"]
+        for criterion in cat["criteria"]
+    }
+    return category_max, criterion_max
+
+
+# Derived from the config on every script run, so clearing load_config
+# (e.g. via the Reload Configuration button) refreshes them as well
+CATEGORY_MAX, CRITERION_MAX = build_score_limits(config)
+
 # Passcode for app access - can be moved to config file later if desired
 APP_PASSCODE = os.environ.get("APP_PASSCODE", "hackathon2025")
 
@@ -99,27 +166,167 @@ def reload_config():
     return new_config
 
 
-# File to store scores
-SCORES_FILE = "scores.json"
+# File to store scores, one JSON record per line (append-only log)
+SCORES_FILE = "scores.jsonl"
+
+# Single JSON document used by earlier versions, migrated on first load
+LEGACY_SCORES_FILE = "scores.json"
+
+# Compact the log once it holds this many lines per unique submission
+COMPACTION_RATIO = 10
+
+
+# Logs at least this large are memory-mapped instead of read in one go
+MMAP_THRESHOLD = 64 * 1024
+
+
+# Build the latest submission per judge_key from raw log lines
+def _replay_scores(lines):
+    scores = {}
+    line_count = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Skip a record torn by a crash mid-write
+            continue
+        line_count += 1
+        scores[record.pop("judge_key")] = record
+    return scores, line_count
+
+
+# Serialises writers within this server process; cached as a resource
+# because module globals are rebuilt on every script run
+@st.cache_resource
+def _scores_thread_lock():
+    return threading.Lock()
+
+
+# Hold exclusive write access to the scores log. The advisory file lock
+# also keeps out other processes sharing the file, where fcntl exists.
+@contextmanager
+def _scores_write_lock():
+    with _scores_thread_lock(), open(SCORES_FILE + ".lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+# Replay the scores log, later records for a judge_key win
+def _read_scores_log():
+    with open(SCORES_FILE, "rb") as file:
+        # mmap setup costs more than it saves on small logs
+        if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+            return _replay_scores(file.read().splitlines())
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _replay_scores(iter(mm.readline, b""))
+
+
+# Rewrite the scores log with one record per submission
+def _write_scores_log(scores):
+    tmp_file = SCORES_FILE + ".tmp"
+    with open(tmp_file, "wb") as file:
+        for judge_key, entry in scores.items():
+            file.write(orjson.dumps({"judge_key": judge_key, **entry}) + b"\n")
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_file, SCORES_FILE)
+    clear_scores_cache()
+
+
+# Parse the scores log, cached on its modification time so reruns
+# only re-read it after someone has saved new scores
+@st.cache_data
+def _load_scores_cached(mtime):
+    scores, line_count = _read_scores_log()
+
+    # Index judge keys by team so views don't have to scan every score
+    by_team = {}
+    for judge_key, entry in scores.items():
+        by_team.setdefault(entry["team"], []).append(judge_key)
+
+    return {"scores": scores, "by_team": by_team}, line_count
+
+
+# Drop the cached scores and everything derived from them
+def clear_scores_cache():
+    _load_scores_cached.clear()
+    calculate_all_team_scores.clear()
+    get_category_winners.clear()
+    compute_overall_standings.clear()
+
+
+# Modification time of the scores log, used as the cache key for scores
+def get_scores_mtime():
+    if os.path.exists(SCORES_FILE):
+        return os.path.getmtime(SCORES_FILE)
+    return 0.0
 
 
 # Initialize or load scores
 def initialize_or_load_scores():
+    if not os.path.exists(SCORES_FILE):
+        if not os.path.exists(LEGACY_SCORES_FILE):
+            return {"scores": {}, "by_team": {}}
+        with _scores_write_lock():
+            # Another session may have migrated while we waited for the lock
+            if not os.path.exists(SCORES_FILE):
+                with open(LEGACY_SCORES_FILE, "rb") as file:
+                    _write_scores_log(orjson.loads(file.read())["scores"])
+
+    scores_data, _ = _load_scores_cached(get_scores_mtime())
+    return scores_data
+
+
+# Drop superseded records from the scores log
+def compact_scores():
+    with _scores_write_lock():
+        scores, _ = _read_scores_log()
+        _write_scores_log(scores)
+
+
+# Append a single judge submission to the scores log
+def save_scores(judge_key, entry):
     if os.path.exists(SCORES_FILE):
-        with open(SCORES_FILE, "r") as file:
-            return json.load(file)
+        scores_data, line_count = _load_scores_cached(get_scores_mtime())
+        submission_count = len(scores_data["scores"])
     else:
-        return {"scores": {}}
+        submission_count, line_count = 0, 0
+
+    record = orjson.dumps({"judge_key": judge_key, **entry}) + b"\n"
+    with _scores_write_lock(), open(SCORES_FILE, "a+b") as file:
+        # Terminate a line torn by a crash so this record isn't lost with it
+        if file.seek(0, os.SEEK_END) > 0:
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                record = b"\n" + record
+
+        file.write(record)
+        file.flush()
+        os.fsync(file.fileno())
+    clear_scores_cache()
+
+    if line_count + 1 > COMPACTION_RATIO * max(submission_count, 1):
+        compact_scores()
 
 
-# Save scores to JSON file
-def save_scores(scores):
-    with open(SCORES_FILE, "w") as file:
-        json.dump(scores, file, indent=4)
+# Image types that can be embedded in a data URI without conversion
+BROWSER_IMAGE_TYPES = {
+    "image/png",
+    "image/jpeg",
+    "image/gif",
+    "image/webp",
+    "image/svg+xml",
+}
 
 
-# Function to load logo image
-def load_logo(logo_path):
+# Load the logo and encode it as a data URI for embedding in HTML, cached
+# so the image is only re-encoded when the logo path changes
+@st.cache_data
+def get_logo_data_uri(logo_path):
     if not logo_path:
         return None
 
@@ -134,99 +341,118 @@ def load_logo(logo_path):
     for path in possible_paths:
         try:
             if os.path.exists(path):
-                return Image.open(path)
+                mime, _ = mimetypes.guess_type(path)
+                if mime in BROWSER_IMAGE_TYPES:
+                    # Embed the file as-is, no need to decode the image
+                    with open(path, "rb") as file:
+                        raw = file.read()
+                else:
+                    # Convert formats browsers can't show to PNG
+                    from PIL import Image
+
+                    buffered = io.BytesIO()
+                    Image.open(path).save(buffered, format="PNG")
+                    raw, mime = buffered.getvalue(), "image/png"
+
+                encoded = base64.b64encode(raw).decode()
+                return f"data:{mime};base64,{encoded}"
         except Exception:
             continue
 
     return None
 
 
-# Helper function to calculate all teams average scores
-def calculate_all_team_scores(scores_data):
+# Helper function to calculate all teams average scores, cached per
+# version of the scores log
+@st.cache_data
+def calculate_all_team_scores(scores_mtime):
+    scores_data = initialize_or_load_scores()
     all_teams = config["teams"]
     all_categories = [cat["name"] for cat in config["categories"]]
-    team_category_scores = {}
-
-    # Initialize scores structure
-    for team in all_teams:
-        team_category_scores[team] = {}
-        for category in all_categories:
-            team_category_scores[team][category] = {
-                "avg_score": 0,
-                "total_possible": 0,
-                "percentage": 0,
-                "judges_count": 0,
-            }
-
-    if not scores_data["scores"]:
-        return team_category_scores
-
-    # Group scores by team
-    for _, data in scores_data["scores"].items():
-        team = data["team"]
-        if team not in team_category_scores:
-            continue
 
-        # Calculate category scores
-        for category, criteria_scores in data["scores"].items():
-            if category not in team_category_scores[team]:
-                continue
-
-            # Get max possible score for this category
-            category_max = sum(
-                criterion["max_score"]
-                for cat in config["categories"]
-                if cat["name"] == category
-                for criterion in cat["criteria"]
-            )
+    # One row per (team, category) submitted by a judge
+    records = [
+        (data["team"], category, sum(criteria_scores.values()))
+        for data in scores_data["scores"].values()
+        for category, criteria_scores in data["scores"].items()
+    ]
+    df = pd.DataFrame(records, columns=["team", "category", "score"]).astype(
+        {"score": "float64"}
+    )
 
-            # Calculate total score for this category
-            category_score = sum(criteria_scores.values())
-
-            # Update the running totals
-            current = team_category_scores[team][category]
-            current["judges_count"] += 1
-
-            # Calculate running average
-            current_avg = current["avg_score"]
-            new_avg = (
-                (current_avg * (current["judges_count"] - 1)) + category_score
-            ) / current["judges_count"]
-            current["avg_score"] = new_avg
-            current["total_possible"] = category_max
-            current["percentage"] = (
-                (new_avg / category_max * 100) if category_max > 0 else 0
-            )
+    # Sum and count per (team, category), reindexed so that teams and
+    # categories without any scores yet still show up with zeros
+    agg = (
+        df.groupby(["team", "category"])["score"]
+        .agg(["sum", "count"])
+        .reindex(
+            pd.MultiIndex.from_product(
+                [all_teams, all_categories], names=["team", "category"]
+            ),
+            fill_value=0,
+        )
+    )
 
-    return team_category_scores
+    # Divide only once per cell, straight from the accumulated sums
+    counts = agg["count"]
+    total_possible = pd.Series(
+        agg.index.get_level_values("category").map(CATEGORY_MAX), index=agg.index
+    )
+    avg_score = (agg["sum"] / counts.where(counts > 0)).fillna(0)
+    percentage = (
+        agg["sum"] * 100 / (counts * total_possible).where(total_possible > 0)
+    ).fillna(0)
+
+    # Tidy frame with one row per (team, category)
+    return pd.DataFrame(
+        {
+            "avg_score": avg_score,
+            "total_possible": total_possible,
+            "percentage": percentage,
+            "judges_count": counts.astype(int),
+        }
+    ).reset_index()
 
 
 # Helper function to get winners for each category
-def get_category_winners(team_scores):
-    category_winners = {}
+@st.cache_data
+def get_category_winners(scores_mtime):
+    agg_df = calculate_all_team_scores(scores_mtime)
 
-    # Get all categories from config
-    all_categories = [cat["name"] for cat in config["categories"]]
+    # Every configured category, even those nobody has judged yet
+    category_winners = {cat["name"]: [] for cat in config["categories"]}
 
-    for category in all_categories:
-        # Create a list of (team, score) tuples for this category
-        category_results = []
-        for team, categories in team_scores.items():
-            if category in categories and categories[category]["judges_count"] > 0:
-                # Use percentage score for ranking
-                category_results.append((team, categories[category]["percentage"]))
+    # Rank all categories in one sort, using percentage score for ranking
+    ranked = agg_df[agg_df["judges_count"] > 0].sort_values(
+        ["category", "percentage"], ascending=[True, False], kind="stable"
+    )
+    for category, group in ranked.groupby("category", sort=False):
+        category_winners[category] = list(zip(group["team"], group["percentage"]))
 
-        # Sort by score (descending)
-        category_results.sort(key=lambda x: x[1], reverse=True)
+    return category_winners
 
-        # Store the results
-        category_winners[category] = category_results
 
-    return category_winners
+# Helper function to rank teams by their average across judged categories
+@st.cache_data
+def compute_overall_standings(scores_mtime):
+    agg_df = calculate_all_team_scores(scores_mtime)
+
+    # Average percentage over judged categories, keeping config order on ties
+    return (
+        agg_df[agg_df["judges_count"] > 0]
+        .groupby("team", sort=False)["percentage"]
+        .agg(["mean", "count"])
+        .reset_index()
+        .set_axis(["Team", "Overall Score", "Categories Judged"], axis=1)
+        .sort_values("Overall Score", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
 
 
 # Streamlit app starts here
 def main():
+    _inject_css()
+
     # Check authentication
     if "authenticated" not in st.session_state:
         st.session_state.authenticated = False
@@ -250,11 +476,11 @@ def main():
         logo_path = config.get("event", {}).get("logo_path", "")
 
         # Display logo in sidebar if available with custom HTML for centering
-        logo_image = load_logo(logo_path)
-        if logo_image:
+        logo_uri = get_logo_data_uri(logo_path)
+        if logo_uri:
             logo_html = f"""
             <div class="logo-container">
-                <img src="data:image/png;base64,{image_to_base64(logo_image)}" alt="{event_title} Logo">
+                <img src="{logo_uri}" alt="{event_title} Logo">
             </div>
             """
             st.markdown(logo_html, unsafe_allow_html=True)
@@ -280,29 +506,27 @@ def main():
             if st.button("Reload Configuration"):
                 # Reload config without using global keyword
                 load_config.clear()
+                clear_scores_cache()
                 st.success("Configuration reloaded successfully!")
                 st.rerun()
 
     # Main content
     if page == "Judge Teams":
-        judge_teams(judge, scores_data)
+        judge_teams(judge)
     elif page == "View Scores":
         view_scores(scores_data)
     else:
         view_leaderboard(scores_data)
 
 
-# Helper function to convert image to base64 for embedding in HTML
-def image_to_base64(img):
-    import base64
-    import io
+# Move the judging form to another team. Runs as a button callback, before
+# the script reruns, so the team selector can still be updated.
+def go_to_team(index):
+    st.session_state.current_team_index = index
+    st.session_state.team_select = config["teams"][index]
 
-    buffered = io.BytesIO()
-    img.save(buffered, format="PNG")
-    return base64.b64encode(buffered.getvalue()).decode()
 
-
-def judge_teams(judge, scores_data):
+def judge_teams(judge):
     st.title("Judge Teams")
 
     # Get the team index from session state
@@ -312,38 +536,37 @@ def judge_teams(judge, scores_data):
     # Ensure team index is within valid range
     team_index = max(0, min(team_index, len(teams) - 1))
 
-    # Team selection with automatic setting of index
-    selected_index = st.selectbox(
-        "Select team to judge:",
-        range(len(teams)),
-        format_func=lambda i: teams[i],
-        index=team_index,
-    )
-
-    # Update the session state if user changes the dropdown
-    if selected_index != team_index:
-        st.session_state.current_team_index = selected_index
-        team_index = selected_index
+    # Restore the selector from the remembered team, e.g. when coming back
+    # from another page (Streamlit drops state for widgets that weren't shown)
+    if st.session_state.get("team_select") not in teams:
+        st.session_state.team_select = teams[team_index]
 
-    team = teams[team_index]
+    team = st.selectbox("Select team to judge:", teams, key="team_select")
+    team_index = teams.index(team)
+    st.session_state.current_team_index = team_index
 
     # Team navigation buttons - always visible
     col1, col2, col3 = st.columns([1, 1, 2])
     with col1:
         if team_index > 0:
-            if st.button("← Previous Team", key="prev_team", use_container_width=True):
-                st.session_state.current_team_index = team_index - 1
-                st.rerun()
+            st.button(
+                "← Previous Team",
+                key="prev_team",
+                use_container_width=True,
+                on_click=go_to_team,
+                args=(team_index - 1,),
+            )
     with col2:
         if team_index < len(teams) - 1:
-            if st.button("Next Team →", key="next_team", use_container_width=True):
-                st.session_state.current_team_index = team_index + 1
-                st.rerun()
+            st.button(
+                "Next Team →",
+                key="next_team",
+                use_container_width=True,
+                on_click=go_to_team,
+                args=(team_index + 1,),
+            )
 
-    st.markdown(
-        f"<div class='team-name' style='font-size: 1.5rem; font-weight: bold; margin-bottom: 10px;'>{team}</div>",
-        unsafe_allow_html=True,
-    )
+    st.markdown(_TEAM_NAME_TPL.format(team), unsafe_allow_html=True)
 
     # Create a form for each team to avoid accidental submission
     with st.form(key=f"team_form_{team}"):
@@ -352,8 +575,7 @@ def judge_teams(judge, scores_data):
         # For each category
         for category in config["categories"]:
             st.markdown(
-                f"<h2 style='font-size: 1.5rem; margin-top: 0.5rem; margin-bottom: 0.5rem;'>{category['name']}</h2>",
-                unsafe_allow_html=True,
+                _CAT_HEADER_TPL.format(category["name"]), unsafe_allow_html=True
             )
             category_scores = {}
 
@@ -362,7 +584,7 @@ def judge_teams(judge, scores_data):
                 col1, col2 = st.columns([3, 1])
                 with col1:
                     st.markdown(
-                        f"<div style='font-size: 1.1rem; font-weight: bold;'>{criterion['name']}</div>",
+                        _CRIT_NAME_TPL.format(criterion["name"]),
                         unsafe_allow_html=True,
                     )
                     st.caption(criterion["description"])
@@ -401,33 +623,38 @@ def judge_teams(judge, scores_data):
             judge_key = f"{judge}_{team}"
 
             # Store scores with timestamp
-            scores_data["scores"][judge_key] = {
-                "judge": judge,
-                "team": team,
-                "scores": team_scores,
-                "notes": notes,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-
-            save_scores(scores_data)
+            save_scores(
+                judge_key,
+                {
+                    "judge": judge,
+                    "team": team,
+                    "scores": team_scores,
+                    "notes": notes,
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                },
+            )
             st.success(f"Scores saved for {team}!")
 
     # Bottom navigation buttons - also always visible
     col1, col2, col3 = st.columns([1, 1, 2])
     with col1:
         if team_index > 0:
-            if st.button(
-                "← Previous Team", key="prev_team_bottom", use_container_width=True
-            ):
-                st.session_state.current_team_index = team_index - 1
-                st.rerun()
+            st.button(
+                "← Previous Team",
+                key="prev_team_bottom",
+                use_container_width=True,
+                on_click=go_to_team,
+                args=(team_index - 1,),
+            )
     with col2:
         if team_index < len(teams) - 1:
-            if st.button(
-                "Next Team →", key="next_team_bottom", use_container_width=True
-            ):
-                st.session_state.current_team_index = team_index + 1
-                st.rerun()
+            st.button(
+                "Next Team →",
+                key="next_team_bottom",
+                use_container_width=True,
+                on_click=go_to_team,
+                args=(team_index + 1,),
+            )
 
 
 def view_scores(scores_data):
@@ -438,9 +665,7 @@ def view_scores(scores_data):
         return
 
     # Team selection for viewing scores
-    teams = list(
-        set(score_data["team"] for score_data in scores_data["scores"].values())
-    )
+    teams = sorted(scores_data["by_team"])
     team = st.selectbox(
         "Select team to view scores:", teams if teams else ["No teams scored yet"]
     )
@@ -448,13 +673,12 @@ def view_scores(scores_data):
     if not teams:
         return
 
-    st.markdown(
-        f"<div style='font-size: 1.5rem; font-weight: bold; margin-bottom: 10px;'>{team}</div>",
-        unsafe_allow_html=True,
-    )
+    st.markdown(_TEAM_NAME_TPL.format(team), unsafe_allow_html=True)
 
     # Filter scores for selected team
-    team_scores = {k: v for k, v in scores_data["scores"].items() if v["team"] == team}
+    team_scores = {
+        k: scores_data["scores"][k] for k in scores_data["by_team"].get(team, [])
+    }
 
     if not team_scores:
         st.info(f"No scores available for {team}.")
@@ -471,33 +695,22 @@ def view_scores(scores_data):
                 )
 
                 # Calculate category total
-                category_max = sum(
-                    criterion["max_score"]
-                    for cat in config["categories"]
-                    if cat["name"] == category
-                    for criterion in cat["criteria"]
-                )
+                category_max = CATEGORY_MAX.get(category, 0)
                 category_score = sum(criteria_scores.values())
 
                 # Display progress bar for category total
-                st.caption(f"Total: {category_score}/{category_max}")
-                st.progress(category_score / category_max if category_max > 0 else 0)
-
-                # Display individual criteria scores
-                for criterion, score in criteria_scores.items():
-                    criterion_config = next(
-                        (
-                            c
-                            for cat in config["categories"]
-                            if cat["name"] == category
-                            for c in cat["criteria"]
-                            if c["name"] == criterion
-                        ),
-                        None,
+                ratio = category_score / category_max if category_max > 0 else 0
+                st.progress(ratio, text=f"Total: {category_score}/{category_max}")
+
+                # Display individual criteria scores as a single table
+                rows = "".join(
+                    _SCORE_ROW_TPL.format(
+                        criterion, score, CRITERION_MAX[(category, criterion)]
                     )
-                    if criterion_config:
-                        max_score = criterion_config["max_score"]
-                        st.caption(f"{criterion}: {score}/{max_score}")
+                    for criterion, score in criteria_scores.items()
+                    if (category, criterion) in CRITERION_MAX
+                )
+                st.markdown(_SCORES_TBL_TPL.format(rows), unsafe_allow_html=True)
 
             # Display notes if available
             if data["notes"]:
@@ -541,19 +754,23 @@ def view_scores(scores_data):
             # Calculate category total and max
             cat_scores = avg_scores[cat_name]
             cat_total = sum(cat_scores.values())
-            cat_max = sum(criterion["max_score"] for criterion in category["criteria"])
+            cat_max = CATEGORY_MAX[cat_name]
 
             # Display progress bar for category total
-            st.caption(f"Average Total: {cat_total:.1f}/{cat_max}")
-            st.progress(cat_total / cat_max if cat_max > 0 else 0)
-
-            # Display individual criteria averages
-            for criterion in category["criteria"]:
-                crit_name = criterion["name"]
-                if crit_name in cat_scores:
-                    max_score = criterion["max_score"]
-                    avg = cat_scores[crit_name]
-                    st.caption(f"{crit_name}: {avg:.1f}/{max_score}")
+            ratio = cat_total / cat_max if cat_max > 0 else 0
+            st.progress(ratio, text=f"Average Total: {cat_total:.1f}/{cat_max}")
+
+            # Display individual criteria averages as a single table
+            rows = "".join(
+                _SCORE_ROW_TPL.format(
+                    criterion["name"],
+                    f"{cat_scores[criterion['name']]:.1f}",
+                    criterion["max_score"],
+                )
+                for criterion in category["criteria"]
+                if criterion["name"] in cat_scores
+            )
+            st.markdown(_SCORES_TBL_TPL.format(rows), unsafe_allow_html=True)
 
 
 def view_leaderboard(scores_data):
@@ -569,10 +786,12 @@ def view_leaderboard(scores_data):
         return
 
     # Calculate all team scores
-    team_scores = calculate_all_team_scores(scores_data)
+    scores_mtime = get_scores_mtime()
+    agg_df = calculate_all_team_scores(scores_mtime)
+    judged = agg_df[agg_df["judges_count"] > 0]
 
     # Get category winners
-    category_winners = get_category_winners(team_scores)
+    category_winners = get_category_winners(scores_mtime)
 
     # Show overall stats
     st.subheader("Judging Progress")
@@ -580,7 +799,7 @@ def view_leaderboard(scores_data):
 
     with col1:
         total_teams = len(config["teams"])
-        judged_teams = len(set(data["team"] for data in scores_data["scores"].values()))
+        judged_teams = len(scores_data["by_team"])
 
         st.markdown(
             f"""
@@ -596,7 +815,7 @@ def view_leaderboard(scores_data):
     with col2:
         total_scores = len(scores_data["scores"])
         judges_participated = len(
-            set(data["judge"] for data in scores_data["scores"].values())
+            {data["judge"] for data in scores_data["scores"].values()}
         )
 
         st.markdown(
@@ -611,16 +830,7 @@ def view_leaderboard(scores_data):
         )
 
     with col3:
-        avg_score = 0
-        score_count = 0
-        for team_data in team_scores.values():
-            for cat_data in team_data.values():
-                if cat_data["judges_count"] > 0:
-                    avg_score += cat_data["percentage"]
-                    score_count += 1
-
-        if score_count > 0:
-            avg_score = avg_score / score_count
+        avg_score = judged["percentage"].mean() if len(judged) else 0.0
 
         st.markdown(
             f"""
@@ -646,7 +856,6 @@ def view_leaderboard(scores_data):
 
         # Create a DataFrame for this category
         winners_df = pd.DataFrame(winners, columns=["Team", "Score"])
-        winners_df["Score"] = winners_df["Score"].map(lambda x: f"{x:.1f}%")
 
         # Show top 3 teams
         top_teams = min(3, len(winners))
@@ -663,7 +872,7 @@ def view_leaderboard(scores_data):
                         <div class="metric-label">#{i + 1} Place</div>
                         <div class="medal">{medal}</div>
                         <div class="metric-value" style="font-size: 1.5rem;">{team}</div>
-                        <div class="metric-label">Score: {winners_df.iloc[i]["Score"]}</div>
+                        <div class="metric-label">Score: {score:.1f}%</div>
                     </div>
                     """,
                     unsafe_allow_html=True,
@@ -673,7 +882,14 @@ def view_leaderboard(scores_data):
         with st.expander("View Full Leaderboard"):
             # Add ranking column
             winners_df.insert(0, "Rank", range(1, len(winners_df) + 1))
-            st.table(winners_df)
+            st.dataframe(
+                winners_df,
+                column_config={
+                    "Score": st.column_config.NumberColumn("Score", format="%.1f%%")
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
 
         st.markdown("<hr>", unsafe_allow_html=True)
 
@@ -681,40 +897,21 @@ def view_leaderboard(scores_data):
     st.subheader("Overall Standings")
 
     # Calculate overall scores
-    overall_scores = []
-    for team, categories in team_scores.items():
-        total_score = 0
-        total_categories = 0
-
-        for category, data in categories.items():
-            if data["judges_count"] > 0:
-                total_score += data["percentage"]
-                total_categories += 1
+    overall_df = compute_overall_standings(scores_mtime)
 
-        if total_categories > 0:
-            avg_score = total_score / total_categories
-            overall_scores.append((team, avg_score, total_categories))
-
-    if not overall_scores:
+    if overall_df.empty:
         st.write("No teams have been fully judged yet.")
     else:
-        # Sort by score (descending)
-        overall_scores.sort(key=lambda x: x[1], reverse=True)
-
-        # Create a DataFrame
-        df = pd.DataFrame(
-            overall_scores, columns=["Team", "Overall Score", "Categories Judged"]
-        )
-        df["Overall Score"] = df["Overall Score"].map(lambda x: f"{x:.1f}%")
-        df.insert(0, "Rank", range(1, len(df) + 1))
+        # Add ranking column
+        overall_df.insert(0, "Rank", range(1, len(overall_df) + 1))
 
         # Show top 3 teams
-        top_teams = min(3, len(overall_scores))
+        top_teams = min(3, len(overall_df))
         cols = st.columns(top_teams)
 
         for i in range(top_teams):
             with cols[i]:
-                team, score, cats = overall_scores[i]
+                team, score = overall_df.iloc[i][["Team", "Overall Score"]]
                 medal = "🥇" if i == 0 else "🥈" if i == 1 else "🥉"
 
                 st.markdown(
@@ -723,14 +920,23 @@ def view_leaderboard(scores_data):
                         <div class="metric-label">#{i + 1} Overall</div>
                         <div class="medal">{medal}</div>
                         <div class="metric-value" style="font-size: 1.5rem;">{team}</div>
-                        <div class="metric-label">Score: {df.iloc[i]["Overall Score"]}</div>
+                        <div class="metric-label">Score: {score:.1f}%</div>
                     </div>
                     """,
                     unsafe_allow_html=True,
                 )
 
         # Show full standings
-        st.table(df)
+        st.dataframe(
+            overall_df,
+            column_config={
+                "Overall Score": st.column_config.NumberColumn(
+                    "Overall Score", format="%.1f%%"
+                )
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
 
 
 # Login screen
@@ -746,11 +952,11 @@ def show_login_screen():
         logo_path = config.get("event", {}).get("logo_path", "")
 
         # Display logo if available
-        logo_image = load_logo(logo_path)
-        if logo_image:
+        logo_uri = get_logo_data_uri(logo_path)
+        if logo_uri:
             logo_html = f"""
             <div class="logo-container">
-                <img src="data:image/png;base64,{image_to_base64(logo_image)}" alt="{event_title} Logo" style="max-width: 300px;">
+                <img src="{logo_uri}" alt="{event_title} Logo" style="max-width: 300px;">
             </div>
             """
             st.markdown(logo_html, unsafe_allow_html=True)